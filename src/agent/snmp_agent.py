@@ -616,3 +616,17 @@ class SimpleSNMPAgent:
     def get_all_data(self) -> Dict[str, Any]:
         """Get all OID data."""
         return self._oid_data.copy()
+
+    def get_all_data_sorted(self, base_oid: Optional[str] = None) -> Dict[str, Any]:
+        """Get OID data in OID order, optionally limited to a base OID.
+
+        Uses the ordering pre-computed by ``_update_data`` so callers
+        don't need to re-sort on every request.
+        """
+        data = self._oid_data
+        if base_oid:
+            return {
+                oid: data[oid] for oid in self._sorted_oids
+                if oid.startswith(base_oid) and oid in data
+            }
+        return {oid: data[oid] for oid in self._sorted_oids if oid in data}
@@ -7,8 +7,10 @@ using standard MIBs (HOST-RESOURCES-MIB, UCD-SNMP-MIB).
 
 import asyncio
 import logging
+import sys
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from pysnmp.hlapi.asyncio import (
     getCmd,
@@ -22,6 +24,7 @@ from pysnmp.hlapi.asyncio import (
     ObjectType,
     ObjectIdentity,
 )
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 
 from ..core.models import (
     MachineInfo,
@@ -84,6 +87,21 @@ class StandardOIDs:
     UCD_CPU_IDLE = "1.3.6.1.4.1.2021.11.11.0"
 
 
+# Max varbinds per GET when re-reading a cached walk; keeps responses
+# well under typical agent message size limits
+_GET_BATCH_SIZE = 25
+# Max GETs in flight to one agent for a single cached walk or OID request
+_GET_BATCH_CONCURRENCY = 4
+
+# Max resolved varbind templates kept per collector (OIDs can come from
+# user requests, so don't let the cache grow without bound)
+_OBJECT_TYPE_CACHE_SIZE = 4096
+# Same reasoning for cached GET results and walked subtrees; when full the
+# oldest entries are dropped (walks hold whole OID lists, so keep fewer)
+_OID_CACHE_SIZE = 4096
+_WALK_CACHE_SIZE = 256
+
+
 class SNMPCollector:
     """
     Collects hardware metrics from remote SNMP agents.
@@ -97,22 +115,93 @@ class SNMPCollector:
         port: int = 161,
         timeout: float = 2.0,
         retries: int = 1,
+        cache_ttl: float = 2.0,
     ):
         self.community = community
         self.port = port
         self.timeout = timeout
         self.retries = retries
+        self.cache_ttl = cache_ttl
         self._engine = SnmpEngine()
+        # (ip, oid) -> (fetched_at, value) for recent single-OID GETs
+        self._oid_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # (ip, base_oid) -> (walked_at, oids) for previously walked subtrees
+        self._walk_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        # oid -> varbind template; pysnmp skips MIB resolution once resolved
+        self._object_types: Dict[str, ObjectType] = {}
+    
+    def _object_type(self, oid: str) -> ObjectType:
+        """Get a reusable ObjectType for *oid*."""
+        object_type = self._object_types.get(oid)
+        if object_type is None:
+            object_type = ObjectType(ObjectIdentity(oid))
+            if len(self._object_types) < _OBJECT_TYPE_CACHE_SIZE:
+                self._object_types[oid] = object_type
+        return object_type
     
-    async def _get_oid(self, ip: str, oid: str) -> Optional[Any]:
-        """Get a single OID value from a host."""
+    async def _get_oid(self, ip: str, oid: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Get a single OID value from a host.
+        
+        Successful results are reused for *max_age* seconds (``cache_ttl``
+        by default) so that overlapping pollers (collection loop, dashboard
+        widgets) don't repeat the same SNMP round-trip. Pass ``max_age=0``
+        for an explicit refresh; the fresh value replaces the cached one.
+        """
+        if max_age is None:
+            max_age = self.cache_ttl
+        key = (ip, oid)
+        now = time.monotonic()
+        cached = self._oid_cache.get(key)
+        if cached and now - cached[0] < max_age:
+            return cached[1]
+        
+        value = await self._fetch_oid(ip, oid)
+        if value is not None:
+            cache = self._oid_cache
+            # Re-insert at the end so entries stay in fetch order
+            cache.pop(key, None)
+            if len(cache) >= _OID_CACHE_SIZE:
+                self._prune_oid_cache(now)
+            cache[key] = (now, value)
+        return value
+    
+    async def _get_oid_each(
+        self, ip: str, oids: List[str], max_age: Optional[float] = None
+    ) -> List[Any]:
+        """Get several OIDs with one GET each, a few at a time.
+        
+        Unlike ``_get_oids``, every OID goes through the per-OID cache (see
+        ``_get_oid`` for *max_age*) and a bad OID doesn't fail the others. Results are in *oids* order;
+        failed GETs give None (or the exception raised).
+        """
+        # Requests can list any number of OIDs; don't send them all to
+        # the agent at once
+        limit = asyncio.Semaphore(_GET_BATCH_CONCURRENCY)
+        
+        async def get(oid: str) -> Optional[Any]:
+            async with limit:
+                return await self._get_oid(ip, oid, max_age)
+        
+        return await asyncio.gather(*(get(oid) for oid in oids), return_exceptions=True)
+    
+    def _prune_oid_cache(self, now: float):
+        """Drop expired GET results, then the oldest ones if still full."""
+        cache = self._oid_cache
+        while cache:
+            key, (fetched_at, _) = next(iter(cache.items()))
+            if now - fetched_at < self.cache_ttl and len(cache) < _OID_CACHE_SIZE:
+                break
+            del cache[key]
+    
+    async def _fetch_oid(self, ip: str, oid: str) -> Optional[Any]:
+        """Query a single OID value from a host, bypassing the cache."""
         try:
             iterator = getCmd(
                 self._engine,
                 CommunityData(self.community),
                 UdpTransportTarget((ip, self.port), timeout=self.timeout, retries=self.retries),
                 ContextData(),
-                ObjectType(ObjectIdentity(oid)),
+                self._object_type(oid),
             )
             
             errorIndication, errorStatus, errorIndex, varBinds = await iterator
@@ -137,7 +226,7 @@ class SNMPCollector:
         results = {}
         
         try:
-            object_types = [ObjectType(ObjectIdentity(oid)) for oid in oids]
+            object_types = [self._object_type(oid) for oid in oids]
             
             iterator = getCmd(
                 self._engine,
@@ -153,7 +242,7 @@ class SNMPCollector:
                 return results
             
             for varBind in varBinds:
-                oid_str = str(varBind[0])
+                oid_str = sys.intern(str(varBind[0]))
                 results[oid_str] = varBind[1]
                 
         except Exception as e:
@@ -163,7 +252,17 @@ class SNMPCollector:
     
     async def _walk_oid(self, ip: str, oid: str) -> Dict[str, Any]:
         """Walk an OID subtree using native pysnmp walkCmd."""
+        results, _ = await self._walk_oid_checked(ip, oid)
+        return results
+    
+    async def _walk_oid_checked(self, ip: str, oid: str) -> Tuple[Dict[str, Any], bool]:
+        """Walk an OID subtree, also reporting whether the walk finished.
+        
+        The flag is False when the walk stopped on an error (e.g. a timeout
+        halfway through a table) and the results may be truncated.
+        """
         results = {}
+        complete = False
 
         try:
             async for (errorIndication, errorStatus, errorIndex, varBinds) in walkCmd(
@@ -171,7 +270,7 @@ class SNMPCollector:
                 CommunityData(self.community),
                 UdpTransportTarget((ip, self.port), timeout=self.timeout, retries=self.retries),
                 ContextData(),
-                ObjectType(ObjectIdentity(oid)),
+                self._object_type(oid),
                 lexicographicMode=False,
             ):
                 if errorIndication:
@@ -182,12 +281,61 @@ class SNMPCollector:
                     break
 
                 for varBind in varBinds:
-                    oid_str = str(varBind[0])
+                    # The same OIDs recur across devices, repeat scans and
+                    # cached walks; share one string object for each
+                    oid_str = sys.intern(str(varBind[0]))
                     results[oid_str] = varBind[1]
+            else:
+                complete = True
 
         except Exception as e:
             logger.debug(f"Failed to walk OID {oid} from {ip}: {e}")
 
+        return results, complete
+    
+    async def _walk_oid_cached(self, ip: str, oid: str, max_age: float) -> Dict[str, Any]:
+        """Walk an OID subtree, re-reading a recent walk's OIDs with GETs.
+        
+        A walk costs one GETNEXT round-trip per OID. If the subtree was
+        walked less than *max_age* seconds ago, its known OIDs are fetched
+        with batched GETs instead; rows added since then show up once the
+        cached walk expires. Falls back to a full walk if any batch fails.
+        """
+        key = (ip, oid)
+        now = time.monotonic()
+        cached = self._walk_cache.get(key)
+        if cached and now - cached[0] < max_age:
+            oids = cached[1]
+            # Large tables (hrSWRunTable) are hundreds of batches; don't
+            # send them all to the agent at once
+            batch_limit = asyncio.Semaphore(_GET_BATCH_CONCURRENCY)
+            
+            async def get_batch(batch_oids: List[str]) -> Dict[str, Any]:
+                async with batch_limit:
+                    return await self._get_oids(ip, batch_oids)
+            
+            batches = await asyncio.gather(*(
+                get_batch(oids[i:i + _GET_BATCH_SIZE])
+                for i in range(0, len(oids), _GET_BATCH_SIZE)
+            ))
+            if all(batches):
+                results = {}
+                for batch in batches:
+                    for oid_str, value in batch.items():
+                        # Rows that disappeared since the walk
+                        if not isinstance(value, (NoSuchObject, NoSuchInstance, EndOfMibView)):
+                            results[oid_str] = value
+                return results
+        
+        results, complete = await self._walk_oid_checked(ip, oid)
+        cache = self._walk_cache
+        cache.pop(key, None)
+        # A truncated walk would hide the missing rows until it expires
+        if results and complete:
+            if len(cache) >= _WALK_CACHE_SIZE:
+                # Oldest walk first, as entries are re-inserted on refresh
+                del cache[next(iter(cache))]
+            cache[key] = (now, list(results))
         return results
     
     async def check_snmp_available(self, ip: str) -> bool:
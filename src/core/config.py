@@ -10,6 +10,10 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import yaml
 
+# Use the libyaml C bindings when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class SNMPConfig:
@@ -52,6 +56,7 @@ class CollectionConfig:
     collect_remote_ssh: bool = False
     snmp_community: str = "public"
     snmp_port: int = 161
+    max_concurrent_walks: int = 4  # Parallel subtree walks per OID scan
     ssh_username: str = ""
     ssh_key_path: str = ""
     ssh_password: str = ""  # Note: Use key-based auth in production
@@ -98,7 +103,7 @@ class Config:
             return cls()
         
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
         
         return cls._from_dict(data)
     
@@ -196,6 +201,7 @@ class Config:
                 "collect_remote_snmp": self.collection.collect_remote_snmp,
                 "collect_remote_ssh": self.collection.collect_remote_ssh,
                 "snmp_community": self.collection.snmp_community,
+                "max_concurrent_walks": self.collection.max_concurrent_walks,
             },
             "mqtt": {
                 "enabled": self.mqtt.enabled,
@@ -211,7 +217,7 @@ class Config:
         }
         
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
 
 
 def get_default_config_path() -> str:
@@ -8,11 +8,13 @@ the current state of all monitored machines.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from .models import HardwareSnapshot, MachineInfo
 from .config import Config
+from .hostname_resolver import get_vendor_from_mac
 
 
 logger = logging.getLogger(__name__)
@@ -29,21 +31,59 @@ class DataManager:
     def __init__(self, config: Config):
         self.config = config
         self._snapshots: Dict[str, HardwareSnapshot] = {}
+        self._snapshots_view = MappingProxyType(self._snapshots)
         self._machines: Dict[str, MachineInfo] = {}
+        self._machines_tuple: Optional[Tuple[MachineInfo, ...]] = None
+        # Serialized machine info keyed by IP, rebuilt under the lock on change
+        self._machine_dicts: Dict[str, dict] = {}
         self._lock = asyncio.Lock()
         self._executor = ThreadPoolExecutor(max_workers=10)
         self._running = False
         self._collection_task: Optional[asyncio.Task] = None
+        # Bumped on every mutation so derived data can be cached
+        self._version = 0
+        # (version, stats) so readers never see a mismatched pair
+        self._stats_cache: Optional[Tuple[int, dict]] = None
+        self._change_listeners: List[Callable[[], None]] = []
         
     @property
-    def machines(self) -> List[MachineInfo]:
-        """Get list of all known machines."""
-        return list(self._machines.values())
+    def machines(self) -> Tuple[MachineInfo, ...]:
+        """Get all known machines.
+        
+        Returns a shared immutable tuple that is only rebuilt when
+        machines are added or removed.
+        """
+        if self._machines_tuple is None:
+            self._machines_tuple = tuple(self._machines.values())
+        return self._machines_tuple
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented whenever machines or snapshots change."""
+        return self._version
+    
+    def get_machine_dicts(self) -> List[dict]:
+        """Get serialized info for all machines.
+        
+        Read-only: the dicts are rebuilt by the mutators under the lock,
+        so this is safe to call from API worker threads.
+        """
+        dicts = self._machine_dicts
+        return [d for m in self.machines if (d := dicts.get(m.ip)) is not None]
+    
+    def get_machine_dict(self, ip: str) -> Optional[dict]:
+        """Get serialized info for one machine (shared; don't mutate)."""
+        return self._machine_dicts.get(ip)
     
     @property
-    def snapshots(self) -> Dict[str, HardwareSnapshot]:
-        """Get all current snapshots keyed by IP."""
-        return self._snapshots.copy()
+    def snapshots(self) -> Mapping[str, HardwareSnapshot]:
+        """Get all current snapshots keyed by IP.
+        
+        Returns a live read-only view rather than a copy. Iterate it only
+        from synchronous code on the event loop (where snapshots are
+        updated), or take a copy first.
+        """
+        return self._snapshots_view
     
     def get_snapshot(self, ip: str) -> Optional[HardwareSnapshot]:
         """Get snapshot for a specific machine."""
@@ -60,9 +100,36 @@ class DataManager:
                 existing = self._machines[machine.ip]
                 # Merge data into existing
                 self._merge_machines(existing, machine)
+                self._resolve_vendor(existing)
+                self._machine_dicts[machine.ip] = existing.to_dict()
             else:
+                self._resolve_vendor(machine)
+                self._machine_dicts[machine.ip] = machine.to_dict()
                 self._machines[machine.ip] = machine
+                self._machines_tuple = None
                 logger.debug(f"Added machine {machine.ip}: hostname={machine.hostname}, method={machine.collection_method}")
+            self._mark_changed()
+
+    def add_change_listener(self, callback: Callable[[], None]):
+        """Register a callback invoked (synchronously) after every mutation."""
+        self._change_listeners.append(callback)
+    
+    def _mark_changed(self):
+        """Bump the data version and notify listeners."""
+        self._version += 1
+        for callback in self._change_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Change listener error: {e}")
+
+    @staticmethod
+    def _resolve_vendor(machine: MachineInfo):
+        """Fill in the vendor from the MAC OUI if it isn't known yet."""
+        if machine.mac_address and (not machine.vendor or machine.vendor == "Unknown"):
+            vendor = get_vendor_from_mac(machine.mac_address)
+            if vendor != "Unknown":
+                machine.vendor = vendor
 
     def _merge_machines(self, existing: MachineInfo, new_info: MachineInfo):
         """Internal helper to merge machine info."""
@@ -112,8 +179,11 @@ class DataManager:
         async with self._lock:
             if ip in self._machines:
                 del self._machines[ip]
+                self._machines_tuple = None
             if ip in self._snapshots:
                 del self._snapshots[ip]
+            self._machine_dicts.pop(ip, None)
+            self._mark_changed()
             logger.info(f"Removed machine: {ip}")
     
     async def update_snapshot(self, snapshot: HardwareSnapshot):
@@ -127,10 +197,16 @@ class DataManager:
                 self._merge_machines(existing, snapshot.machine)
                 # Point snapshot at our authoritative machine object
                 snapshot.machine = existing
+                self._resolve_vendor(existing)
+                self._machine_dicts[ip] = existing.to_dict()
             else:
+                self._resolve_vendor(snapshot.machine)
+                self._machine_dicts[ip] = snapshot.machine.to_dict()
                 self._machines[ip] = snapshot.machine
+                self._machines_tuple = None
             
             self._snapshots[ip] = snapshot
+            self._mark_changed()
             logger.debug(f"Updated snapshot for {ip}")
     
     async def update_snapshots(self, snapshots: List[HardwareSnapshot]):
@@ -142,9 +218,15 @@ class DataManager:
                     existing = self._machines[ip]
                     self._merge_machines(existing, snapshot.machine)
                     snapshot.machine = existing
+                    self._resolve_vendor(existing)
+                    self._machine_dicts[ip] = existing.to_dict()
                 else:
+                    self._resolve_vendor(snapshot.machine)
+                    self._machine_dicts[ip] = snapshot.machine.to_dict()
                     self._machines[ip] = snapshot.machine
+                    self._machines_tuple = None
                 self._snapshots[ip] = snapshot
+            self._mark_changed()
             logger.info(f"Updated {len(snapshots)} snapshots")
     
     def get_machines_by_status(self, online: bool = True) -> List[MachineInfo]:
@@ -161,29 +243,45 @@ class DataManager:
         return stale
     
     def get_aggregated_stats(self) -> dict:
-        """Get aggregated statistics across all machines."""
-        if not self._snapshots:
+        """Get aggregated statistics across all machines.
+        
+        The result is cached until the next mutation, so repeated calls
+        (dashboard polling, SSE clients) don't re-scan every snapshot.
+        """
+        cached = self._stats_cache
+        version = self._version
+        if cached is None or cached[0] != version:
+            # Tag with the version seen before computing; a concurrent update
+            # then just makes the next call recompute
+            cached = self._stats_cache = (version, self._compute_aggregated_stats())
+        return cached[1]
+    
+    def _compute_aggregated_stats(self) -> dict:
+        """Compute aggregated statistics from the current snapshots."""
+        # Take a copy up front; this may be called from API worker threads
+        snapshots = list(self._snapshots.values())
+        if not snapshots:
             return {
                 "machine_count": 0,
                 "online_count": 0,
                 "offline_count": 0,
             }
         
-        online = len([s for s in self._snapshots.values() if s.machine.is_online])
+        online = len([s for s in snapshots if s.machine.is_online])
         
-        total_cpu = sum(s.cpu.usage_percent for s in self._snapshots.values())
-        avg_cpu = total_cpu / len(self._snapshots) if self._snapshots else 0
+        total_cpu = sum(s.cpu.usage_percent for s in snapshots)
+        avg_cpu = total_cpu / len(snapshots) if snapshots else 0
         
-        total_memory = sum(s.memory.total_bytes for s in self._snapshots.values())
-        used_memory = sum(s.memory.used_bytes for s in self._snapshots.values())
+        total_memory = sum(s.memory.total_bytes for s in snapshots)
+        used_memory = sum(s.memory.used_bytes for s in snapshots)
         
-        total_storage = sum(s.storage.total_bytes for s in self._snapshots.values())
-        used_storage = sum(s.storage.used_bytes for s in self._snapshots.values())
+        total_storage = sum(s.storage.total_bytes for s in snapshots)
+        used_storage = sum(s.storage.used_bytes for s in snapshots)
         
         return {
-            "machine_count": len(self._snapshots),
+            "machine_count": len(snapshots),
             "online_count": online,
-            "offline_count": len(self._snapshots) - online,
+            "offline_count": len(snapshots) - online,
             "avg_cpu_percent": round(avg_cpu, 2),
             "total_memory_gb": round(total_memory / (1024**3), 2),
             "used_memory_gb": round(used_memory / (1024**3), 2),
@@ -197,6 +295,9 @@ class DataManager:
         """Clear all stored data."""
         self._snapshots.clear()
         self._machines.clear()
+        self._machines_tuple = None
+        self._machine_dicts.clear()
+        self._mark_changed()
         logger.info("Cleared all data")
     
     def __len__(self) -> int:
@@ -53,6 +53,16 @@ class DatabaseManager:
             """, (device_ip, json.dumps(config)))
             conn.commit()
 
+    def save_mqtt_configs(self, configs: Dict[str, Dict[str, Any]]):
+        """Save several MQTT configurations in a single transaction."""
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO mqtt_configs (device_ip, config_json)
+                VALUES (?, ?)
+            """, [(ip, json.dumps(config)) for ip, config in configs.items()])
+            conn.commit()
+
     def get_mqtt_configs(self) -> Dict[str, Dict]:
         """Load all MQTT configurations."""
         configs = {}
@@ -85,6 +95,16 @@ class DatabaseManager:
             """, (f"widget:{widget_id}", json.dumps(config)))
             conn.commit()
 
+    def save_widget_configs(self, configs: Dict[str, Dict[str, Any]]):
+        """Save several widget configurations in a single transaction."""
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO kv_store (key, value)
+                VALUES (?, ?)
+            """, [(f"widget:{wid}", json.dumps(config)) for wid, config in configs.items()])
+            conn.commit()
+
     def get_widget_configs(self) -> Dict[str, Dict]:
         """Load all widget configurations."""
         widgets = {}
@@ -107,3 +127,13 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM kv_store WHERE key = ?", (f"widget:{widget_id}",))
             conn.commit()
+
+    def delete_widget_configs(self, widget_ids: List[str]):
+        """Delete several widget configurations in a single transaction."""
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "DELETE FROM kv_store WHERE key = ?",
+                [(f"widget:{wid}",) for wid in widget_ids],
+            )
+            conn.commit()
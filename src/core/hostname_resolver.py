@@ -7,6 +7,7 @@ Provides functions to resolve hostnames from IP addresses using:
 - mDNS/Bonjour discovery
 """
 
+import functools
 import socket
 import logging
 import subprocess
@@ -423,6 +424,16 @@ OUI_VENDORS = {
 }
 
 
+# OUI prefixes keyed by their 24-bit integer value for fast lookup
+OUI_VENDORS_INT: Dict[int, str] = {
+    int(oui.replace(":", ""), 16): vendor for oui, vendor in OUI_VENDORS.items()
+}
+
+
+_MAC_SEPARATOR = re.compile(r"[:-]")
+
+
+@functools.lru_cache(maxsize=4096)
 def get_vendor_from_mac(mac: str) -> str:
     """
     Look up vendor from MAC address using OUI prefix.
@@ -436,10 +447,17 @@ def get_vendor_from_mac(mac: str) -> str:
     if not mac:
         return "Unknown"
     
-    # Normalize MAC address
-    mac = mac.upper().replace("-", ":")
-    
-    # Get OUI prefix (first 3 octets)
-    oui = ":".join(mac.split(":")[:3])
+    # OUI prefix (first 3 octets) as a 24-bit integer. Octets may lack
+    # their leading zero (macOS `arp -a` prints 0:5:5:...), so pad each.
+    octets = _MAC_SEPARATOR.split(mac)
+    if len(octets) < 3:
+        return "Unknown"
+    hex_digits = "".join(octet.zfill(2) for octet in octets[:3])
+    if len(hex_digits) != 6:
+        return "Unknown"
+    try:
+        oui = int(hex_digits, 16)
+    except ValueError:
+        return "Unknown"
     
-    return OUI_VENDORS.get(oui, "Unknown")
+    return OUI_VENDORS_INT.get(oui, "Unknown")
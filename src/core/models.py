@@ -50,6 +50,26 @@ class MachineInfo:
     def __post_init__(self):
         if isinstance(self.last_seen, str):
             self.last_seen = datetime.fromisoformat(self.last_seen)
+    
+    def to_dict(self) -> dict:
+        """Convert machine info to dictionary for serialization."""
+        return {
+            "ip": self.ip,
+            "hostname": self.hostname,
+            "os_type": self.os_type,
+            "uptime_seconds": self.uptime_seconds,
+            "is_online": self.is_online,
+            "last_seen": self.last_seen.isoformat(),
+            "collection_method": self.collection_method,
+            "mac_address": self.mac_address,
+            "vendor": self.vendor or "Unknown",
+            "snmp_active": self.snmp_active,
+            "dns_name": self.dns_name,
+            "mdns_name": self.mdns_name,
+            "netbios_name": self.netbios_name,
+            "snmp_sysname": self.snmp_sysname,
+            "display_name": self.display_name,
+        }
 
 
 @dataclass
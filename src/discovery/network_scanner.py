@@ -9,8 +9,9 @@ import asyncio
 import ipaddress
 import logging
 import platform
+import re
 import subprocess
-from typing import List, Set, Optional, Dict
+from typing import AsyncIterator, List, Set, Optional, Dict
 from datetime import datetime
 
 from ..core.models import MachineInfo
@@ -20,6 +21,12 @@ from ..core.hostname_resolver import resolve_hostname, resolve_all_names, get_ma
 
 logger = logging.getLogger(__name__)
 
+# ARP table line formats
+# Windows: "192.168.1.1  00-aa-bb-cc-dd-ee  dynamic"
+_ARP_WINDOWS_RE = re.compile(r"(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f-]+)", re.I)
+# Unix: "hostname (192.168.1.1) at 00:aa:bb:cc:dd:ee"
+_ARP_UNIX_RE = re.compile(r"\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-f:]+)", re.I)
+
 
 class NetworkScanner:
     """
@@ -39,9 +46,23 @@ class NetworkScanner:
         """
         Run all configured discovery methods and return unique machines.
         """
-        discovered: Set[str] = set()
         machines: List[MachineInfo] = []
-        machines_by_ip: Dict[str, MachineInfo] = {}  # Track by IP for updates
+        async for batch in self.discover_iter():
+            machines.extend(batch)
+        
+        logger.info(f"Discovered {len(machines)} machines")
+        return machines
+    
+    async def discover_iter(self) -> AsyncIterator[List[MachineInfo]]:
+        """
+        Run all configured discovery methods, yielding machines in batches.
+        
+        Subnets are swept concurrently and each subnet's machines are
+        yielded as soon as that sweep finishes, so callers can register
+        them without waiting for the slowest subnet.
+        """
+        discovered: Set[str] = set()
+        exclude = set(self.config.exclude_ips)
         
         # Get ARP data FIRST so we have MAC addresses available
         arp_data: Dict[str, str] = {}
@@ -53,44 +74,56 @@ class NetworkScanner:
                 logger.error(f"Error reading ARP table: {e}")
         
         # Add static hosts first
+        static_hosts = []
         for host in self.config.static_hosts:
-            if host and host not in self.config.exclude_ips:
+            if host and host not in exclude and host not in discovered:
                 discovered.add(host)
-                mac = arp_data.get(host, "")
-                if mac:
-                    machine = await self._enrich_machine_info_with_mac(host, mac, "static")
-                else:
-                    machine = await self._enrich_machine_info(host, "static")
-                machines.append(machine)
-                machines_by_ip[host] = machine
+                static_hosts.append(host)
+        if static_hosts:
+            yield await self._enrich_hosts(static_hosts, arp_data, "static")
         
-        # Scan subnets
-        for subnet in self.config.subnets:
+        # Scan subnets concurrently, handling each as it completes
+        async def sweep(subnet: str) -> List[str]:
             try:
-                hosts = await self.ping_sweep(subnet)
-                for ip in hosts:
-                    if ip not in discovered and ip not in self.config.exclude_ips:
-                        discovered.add(ip)
-                        mac = arp_data.get(ip, "")
-                        if mac:
-                            machine = await self._enrich_machine_info_with_mac(ip, mac, "ping")
-                        else:
-                            machine = await self._enrich_machine_info(ip, "ping")
-                        machines.append(machine)
-                        machines_by_ip[ip] = machine
+                return await self.ping_sweep(subnet)
             except Exception as e:
                 logger.error(f"Error scanning subnet {subnet}: {e}")
+                return []
+        
+        tasks = [asyncio.create_task(sweep(subnet)) for subnet in self.config.subnets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                hosts = await next_done
+                new_hosts = []
+                for ip in hosts:
+                    if ip not in discovered and ip not in exclude:
+                        discovered.add(ip)
+                        new_hosts.append(ip)
+                if new_hosts:
+                    yield await self._enrich_hosts(new_hosts, arp_data, "ping")
+        finally:
+            # Don't leave sweeps running if the caller stops early
+            for task in tasks:
+                task.cancel()
         
         # Add ARP-only entries (hosts not found by ping but in ARP table)
-        for ip, mac in arp_data.items():
-            if ip not in discovered and ip not in self.config.exclude_ips:
+        arp_hosts = []
+        for ip in arp_data:
+            if ip not in discovered and ip not in exclude:
                 discovered.add(ip)
-                machine = await self._enrich_machine_info_with_mac(ip, mac, "arp")
-                machines.append(machine)
-                machines_by_ip[ip] = machine
-        
-        logger.info(f"Discovered {len(machines)} machines")
-        return machines
+                arp_hosts.append(ip)
+        if arp_hosts:
+            yield await self._enrich_hosts(arp_hosts, arp_data, "arp")
+    
+    async def _enrich_hosts(
+        self, ips: List[str], arp_data: Dict[str, str], method: str
+    ) -> List[MachineInfo]:
+        """Enrich several hosts concurrently, using ARP MACs where known."""
+        return list(await asyncio.gather(*(
+            self._enrich_machine_info_with_mac(ip, arp_data[ip], method)
+            if arp_data.get(ip) else self._enrich_machine_info(ip, method)
+            for ip in ips
+        )))
     
     async def _enrich_machine_info(self, ip: str, method: str) -> MachineInfo:
         """Enrich machine info with hostname, MAC address, and vendor.
@@ -264,17 +297,10 @@ class NetworkScanner:
             stdout, _ = await proc.communicate()
             output = stdout.decode("utf-8", errors="ignore")
             
-            # Parse ARP output
+            # Parse ARP output; the line format is fixed per platform
+            arp_re = _ARP_WINDOWS_RE if self._is_windows else _ARP_UNIX_RE
             for line in output.split("\n"):
-                # Look for IP addresses in parentheses or at start
-                import re
-                
-                if self._is_windows:
-                    # Windows format: "192.168.1.1  00-aa-bb-cc-dd-ee  dynamic"
-                    match = re.search(r"(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f-]+)", line, re.I)
-                else:
-                    # Unix format: "hostname (192.168.1.1) at 00:aa:bb:cc:dd:ee"
-                    match = re.search(r"\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-f:]+)", line, re.I)
+                match = arp_re.search(line)
                 
                 if match:
                     ip = match.group(1)
@@ -9,18 +9,31 @@ Provides REST API and web UI for:
 """
 
 import asyncio
+import functools
+import hashlib
+import importlib.util
 import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-from contextlib import asynccontextmanager
+from collections import defaultdict
+from itertools import islice
+from typing import Callable, List, Dict, Optional, Any, Tuple
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
+from anyio import to_thread
 import uvicorn
-import json
+import orjson
 
 from ..core.models import HardwareSnapshot
 from ..core.config import Config
@@ -51,11 +64,46 @@ config: Optional[Config] = None
 # Background tasks
 _discovery_task: Optional[asyncio.Task] = None
 _collection_task: Optional[asyncio.Task] = None
+_persist_task: Optional[asyncio.Task] = None
 _running = False
+_COLLECTION_CONCURRENCY = 20  # Max machines collected at the same time
+_IO_POOL_WORKERS = 16  # Threads for blocking collectors and scan post-processing
 
 # Widget and MQTT device configuration storage
 _widgets: Dict[str, Dict] = {}  # widget_id -> widget config
 _mqtt_device_configs: Dict[str, Dict] = {}  # device_ip -> mqtt config
+_widgets_by_device: Dict[str, Dict[str, Dict]] = {}  # device_ip -> widget_id -> widget config
+
+# Keys changed since the last database flush (written back in batches)
+_widgets_dirty: set = set()
+_mqtt_configs_dirty: set = set()
+_PERSIST_INTERVAL_SECONDS = 2
+# Cancelling the persist task doesn't stop a flush already running in a
+# worker thread, so the shutdown flush could otherwise overlap it
+_flush_lock = threading.Lock()
+
+# Static HTML pages, read once at startup
+_INDEX_HTML: Optional[bytes] = None
+_INDEX_ETAG: Optional[str] = None
+_DEVICE_HTML: Optional[bytes] = None
+_DEVICE_ETAG: Optional[str] = None
+_HTML_CACHE_CONTROL = "public, max-age=60"
+
+# Serialized /api/devices response: (built_at, data_manager version, body)
+_devices_cache: Optional[Tuple[float, int, bytes]] = None
+_DEVICES_CACHE_TTL = 2.0
+
+# ETags for polled JSON endpoints are derived from the data manager version;
+# the per-process token keeps them from matching across restarts
+_ETAG_TOKEN = f"{os.getpid():x}{int(time.time()):x}"
+_POLL_CACHE_CONTROL = "max-age=2"
+
+# SSE fan-out: the event is swapped for a fresh one on every data change,
+# waking all waiting clients; the stats payload is shared between them
+_stats_changed = asyncio.Event()
+_stats_payload: Optional[Tuple[int, bytes]] = None
+_SSE_MIN_INTERVAL_SECONDS = 1.0
+_SSE_KEEPALIVE_SECONDS = 30
 
 
 # Pydantic models for API
@@ -135,11 +183,26 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     global data_manager, scanner, local_collector, snmp_collector, ssh_collector
     global mqtt_service, snmp_agent, db, config
-    global _discovery_task, _collection_task, _running
+    global _discovery_task, _collection_task, _persist_task, _running
+    global _INDEX_HTML, _INDEX_ETAG, _DEVICE_HTML, _DEVICE_ETAG
 
     # Startup
     logger.info("Starting web server...")
 
+    # Read-only and DB-backed endpoints are plain `def` handlers that run in
+    # the anyio threadpool; raise its default 40-thread limit
+    to_thread.current_default_thread_limiter().total_tokens = 200
+
+    # Blocking collectors (psutil, SSH) share one bounded pool so bursts of
+    # collection work can't spawn unbounded threads
+    app.state.pool = ThreadPoolExecutor(
+        max_workers=_IO_POOL_WORKERS, thread_name_prefix="snmp-io"
+    )
+
+    # Cache static pages; they don't change during the process lifetime
+    _INDEX_HTML, _INDEX_ETAG = _load_html("index.html")
+    _DEVICE_HTML, _DEVICE_ETAG = _load_html("device.html")
+
     # Initialize with default config if not set
     if config is None:
         from ..core.config import get_default_config_path
@@ -151,6 +214,7 @@ async def lifespan(app: FastAPI):
             config = Config()
 
     data_manager = DataManager(config)
+    data_manager.add_change_listener(_notify_stats_changed)
     scanner = NetworkScanner(config.discovery)
     local_collector = LocalCollector()
     snmp_collector = SNMPCollector(
@@ -164,15 +228,21 @@ async def lifespan(app: FastAPI):
             key_path=config.collection.ssh_key_path,
         )
 
-    # Initialize database for persistence
-    db = DatabaseManager()
-    _widgets.update(db.get_widget_configs())
-    _mqtt_device_configs.update(db.get_mqtt_configs())
-    logger.info(f"Loaded {len(_widgets)} widgets and {len(_mqtt_device_configs)} MQTT configs from database")
+    # Initialize database for persistence (sqlite calls run off the event loop)
+    db = await asyncio.to_thread(DatabaseManager)
 
-    # Initialize and start MQTT client
+    # Load persisted configs while the MQTT client connects
     mqtt_service = MQTTBrokerService(config)
-    await mqtt_service.start()
+    widget_configs, mqtt_configs, _ = await asyncio.gather(
+        asyncio.to_thread(db.get_widget_configs),
+        asyncio.to_thread(db.get_mqtt_configs),
+        mqtt_service.start(),
+    )
+    _widgets.update(widget_configs)
+    for widget_id, widget in _widgets.items():
+        _widgets_by_device.setdefault(widget.get("device_ip"), {})[widget_id] = widget
+    _mqtt_device_configs.update(mqtt_configs)
+    logger.info(f"Loaded {len(_widgets)} widgets and {len(_mqtt_device_configs)} MQTT configs from database")
 
     # Start SNMP Agent to serve aggregated metrics
     snmp_agent = SimpleSNMPAgent(data_manager, config.snmp.port)
@@ -180,8 +250,8 @@ async def lifespan(app: FastAPI):
     logger.info(f"SNMP Agent started on port {config.snmp.port}")
 
     # Collect local metrics immediately (run in executor to avoid blocking)
-    loop = asyncio.get_event_loop()
-    local_snapshot = await loop.run_in_executor(None, local_collector.collect_all)
+    loop = asyncio.get_running_loop()
+    local_snapshot = await loop.run_in_executor(app.state.pool, local_collector.collect_all)
     await data_manager.update_snapshot(local_snapshot)
     logger.info(f"Local machine: {local_snapshot.machine.hostname}")
 
@@ -190,18 +260,21 @@ async def lifespan(app: FastAPI):
     if static_hosts:
         logger.info(f"Collecting from static hosts (background): {static_hosts}")
 
+        async def collect_host(ip: str):
+            try:
+                logger.debug(f"Trying SNMP on {ip}")
+                snapshot = await snmp_collector.collect_all(ip)
+                if snapshot:
+                    await data_manager.update_snapshot(snapshot)
+                    logger.info(f"SNMP success: {ip} -> {snapshot.machine.hostname}")
+                else:
+                    logger.warning(f"SNMP failed for {ip}: no snapshot returned")
+            except Exception as e:
+                logger.error(f"SNMP error for {ip}: {e}")
+
         async def collect_priority():
-            for ip in static_hosts:
-                try:
-                    logger.debug(f"Trying SNMP on {ip}")
-                    snapshot = await snmp_collector.collect_all(ip)
-                    if snapshot:
-                        await data_manager.update_snapshot(snapshot)
-                        logger.info(f"SNMP success: {ip} -> {snapshot.machine.hostname}")
-                    else:
-                        logger.warning(f"SNMP failed for {ip}: no snapshot returned")
-                except Exception as e:
-                    logger.error(f"SNMP error for {ip}: {e}")
+            # Poll all static hosts concurrently so one slow host doesn't delay the rest
+            await asyncio.gather(*(collect_host(ip) for ip in static_hosts))
 
         asyncio.create_task(collect_priority())
 
@@ -209,6 +282,7 @@ async def lifespan(app: FastAPI):
     _running = True
     _discovery_task = asyncio.create_task(_discovery_loop())
     _collection_task = asyncio.create_task(_collection_loop())
+    _persist_task = asyncio.create_task(_persist_loop())
 
     logger.info("Web server started")
 
@@ -218,10 +292,20 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down web server...")
     _running = False
 
-    if _discovery_task:
-        _discovery_task.cancel()
-    if _collection_task:
-        _collection_task.cancel()
+    # Cancel background loops and wait for them to actually finish
+    tasks = [t for t in (_discovery_task, _collection_task, _persist_task) if t]
+    for task in tasks:
+        task.cancel()
+    with suppress(asyncio.CancelledError):
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Write back any config changes not yet persisted
+    try:
+        await asyncio.to_thread(_flush_dirty_configs)
+    except Exception as e:
+        logger.error(f"Config persist error: {e}")
+
+    app.state.pool.shutdown(wait=False)
 
     # Stop SNMP Agent
     if snmp_agent:
@@ -242,15 +326,25 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Add CORS middleware. The dashboard is served from this app, so only
+# explicitly listed external origins need cross-origin access.
+_cors_origins = [
+    o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:8000").split(",")
+    if o.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_cors_origins,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress large JSON payloads (OID listings, device lists). Level 1 gives
+# most of the size reduction for a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Mount static files
 from pathlib import Path
 static_dir = Path(__file__).parent / "static"
@@ -258,104 +352,263 @@ if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 
+def _load_html(name: str):
+    """Read a static HTML page and compute its ETag."""
+    html_path = static_dir / name
+    if not html_path.exists():
+        return None, None
+    content = html_path.read_bytes()
+    # Weak: GZipMiddleware serves gzip and identity bodies under the same tag
+    return content, f'W/"{hashlib.md5(content).hexdigest()}"'
+
+
+# Served when static/index.html is missing
+_INDEX_FALLBACK_HTML = b"""
+        <html>
+            <head><title>SNMP Agent Monitor</title></head>
+            <body>
+                <h1>SNMP Agent Monitor</h1>
+                <p>Dashboard is loading... If this persists, check static files.</p>
+                <p>API Documentation: <a href="/docs">/docs</a></p>
+            </body>
+        </html>
+        """
+
+
+# Pre-encoded 404 bodies for lookups that miss often (stale dashboard links)
+_DEVICE_PAGE_NOT_FOUND = b'{"detail":"Device page not found"}'
+_DEVICE_NOT_FOUND = b'{"detail":"Device not found"}'
+
+
+def _not_found(body: bytes) -> Response:
+    """Return a 404 without going through HTTPException handling."""
+    # Built per request: middleware appends to the response's header list
+    return Response(content=body, status_code=404, media_type="application/json")
+
+
+def _json_response(content: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize *content* with orjson, skipping FastAPI's response encoding."""
+    return Response(content=orjson.dumps(content), media_type="application/json", headers=headers)
+
+
+def _cached_html_response(request: Request, content: bytes, etag: str) -> Response:
+    """Serve cached HTML, answering 304 when the client copy is current."""
+    headers = {"ETag": etag, "Cache-Control": _HTML_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
+
+def _notify_stats_changed():
+    """Wake SSE clients waiting for the next data change."""
+    global _stats_changed
+    event, _stats_changed = _stats_changed, asyncio.Event()
+    event.set()
+
+
+def _sse_response(
+    get_event: Callable[[], asyncio.Event],
+    get_payload: Callable[[], bytes],
+    min_interval: float = 0.0,
+) -> StreamingResponse:
+    """Stream *get_payload()* as server-sent events each time data changes.
+    
+    *get_event* returns the event that will be set on the next change;
+    it is fetched before each send so no change is missed. Waits at
+    least *min_interval* seconds between events.
+    """
+    
+    async def event_generator():
+        while True:
+            changed = get_event()
+            yield b"data: " + get_payload() + b"\n\n"
+            
+            if min_interval:
+                await asyncio.sleep(min_interval)
+            
+            # Sleep until the data changes, with periodic keep-alive comments
+            while not changed.is_set():
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=_SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            # Keep events uncompressed so each one is flushed immediately
+            "Content-Encoding": "identity",
+        },
+    )
+
+
+def _get_stats_payload() -> bytes:
+    """Serialized aggregated stats, rebuilt only when the data changes."""
+    global _stats_payload
+    version = data_manager.version
+    if _stats_payload is None or _stats_payload[0] != version:
+        _stats_payload = (version, orjson.dumps(data_manager.get_aggregated_stats()))
+    return _stats_payload[1]
+
+
 # Background loops
 async def _discovery_loop():
     """Background task for network discovery."""
     global data_manager, scanner, config
     
+    loop = asyncio.get_running_loop()
+
     logger.info("Starting discovery loop")
     while _running and config.discovery.enabled:
+        # Schedule from the start of the pass so slow scans don't add up
+        deadline = loop.time() + config.discovery.scan_interval_seconds
         try:
             logger.debug("Running network discovery...")
-            machines = await scanner.discover_all()
-            logger.info(f"Discovery found {len(machines)} machines")
+            found = 0
 
-            for machine in machines:
-                await data_manager.add_machine(machine)
+            # Register machines as each discovery segment completes
+            async for machines in scanner.discover_iter():
+                for machine in machines:
+                    await data_manager.add_machine(machine)
+                found += len(machines)
 
-            logger.debug("Finished adding machines")
+            logger.info(f"Discovery found {found} machines")
         except Exception as e:
             logger.error(f"Discovery error: {e}")
         
-        await asyncio.sleep(config.discovery.scan_interval_seconds)
+        await asyncio.sleep(max(0, deadline - loop.time()))
 
 
 async def _collection_loop():
     """Background task for metrics collection."""
     global data_manager, local_collector, snmp_collector, ssh_collector, config
     
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     
     while _running:
+        # Schedule from the start of the pass so slow collections don't add up
+        deadline = loop.time() + config.collection.interval_seconds
         try:
             machines = data_manager.machines
             logger.debug(f"Collection loop: processing {len(machines)} machines")
             
-            for machine in machines:
-                try:
-                    snapshot = None
-                    
-                    if machine.ip == local_collector._local_ip:
-                        # Run blocking psutil calls in executor
-                        snapshot = await loop.run_in_executor(None, local_collector.collect_all)
-                    elif config.collection.collect_remote_snmp:
-                        snapshot = await snmp_collector.collect_all(machine.ip)
-                    
-                    if not snapshot and ssh_collector and config.collection.collect_remote_ssh:
-                        # SSH is blocking, run in executor
-                        snapshot = await loop.run_in_executor(None, ssh_collector.collect_all, machine.ip)
-                    
-                    if snapshot:
-                        await data_manager.update_snapshot(snapshot)
-                        if snapshot.machine.snmp_active:
-                            logger.info(f"SNMP collected from {machine.ip}: {snapshot.machine.hostname}")
+            # Bind per-pass so the hot loop skips repeated attribute lookups
+            # (the SNMP collector can be replaced by a config update)
+            local_ip = local_collector._local_ip
+            collect_local = local_collector.collect_all
+            collect_snmp = snmp_collector.collect_all
+            collect_ssh = ssh_collector.collect_all if ssh_collector else None
+            update_snapshot = data_manager.update_snapshot
+            pool = app.state.pool
+            semaphore = asyncio.Semaphore(_COLLECTION_CONCURRENCY)
+            
+            async def collect_machine(machine):
+                async with semaphore:
+                    try:
+                        snapshot = None
+                        
+                        if machine.ip == local_ip:
+                            # Run blocking psutil calls in executor
+                            snapshot = await loop.run_in_executor(pool, collect_local)
+                        elif config.collection.collect_remote_snmp:
+                            snapshot = await collect_snmp(machine.ip)
                         
-                except Exception as e:
-                    logger.error(f"Error collecting from {machine.ip}: {e}")
+                        if not snapshot and collect_ssh and config.collection.collect_remote_ssh:
+                            # SSH is blocking, run in executor
+                            snapshot = await loop.run_in_executor(pool, collect_ssh, machine.ip)
+                        
+                        if snapshot:
+                            await update_snapshot(snapshot)
+                            if snapshot.machine.snmp_active:
+                                logger.info(f"SNMP collected from {machine.ip}: {snapshot.machine.hostname}")
+                            
+                    except Exception as e:
+                        logger.error(f"Error collecting from {machine.ip}: {e}")
+            
+            # Collect machines concurrently; a pass takes about as long as the slowest device
+            await asyncio.gather(*(collect_machine(m) for m in machines))
             
         except Exception as e:
             logger.error(f"Collection error: {e}")
         
-        await asyncio.sleep(config.collection.interval_seconds)
+        await asyncio.sleep(max(0, deadline - loop.time()))
+
+
+def _flush_dirty_configs():
+    """Persist widget/MQTT config changes made since the last flush."""
+    if db is None:
+        return
+    
+    with _flush_lock:
+        # pop() re-reads the current value, so a change made mid-flush is
+        # either included here or re-marked dirty for the next flush
+        widget_saves, widget_deletes = {}, []
+        while _widgets_dirty:
+            widget_id = _widgets_dirty.pop()
+            widget = _widgets.get(widget_id)
+            if widget is None:
+                widget_deletes.append(widget_id)
+            else:
+                widget_saves[widget_id] = widget
+        
+        mqtt_saves = {}
+        while _mqtt_configs_dirty:
+            device_ip = _mqtt_configs_dirty.pop()
+            if device_ip in _mqtt_device_configs:
+                mqtt_saves[device_ip] = _mqtt_device_configs[device_ip]
+        
+        try:
+            if widget_saves:
+                db.save_widget_configs(widget_saves)
+                widget_saves = {}
+            if widget_deletes:
+                db.delete_widget_configs(widget_deletes)
+                widget_deletes = []
+            if mqtt_saves:
+                db.save_mqtt_configs(mqtt_saves)
+        except Exception:
+            # Re-mark whatever wasn't written so the next flush retries it
+            _widgets_dirty.update(widget_saves)
+            _widgets_dirty.update(widget_deletes)
+            _mqtt_configs_dirty.update(mqtt_saves)
+            raise
+
+
+async def _persist_loop():
+    """Background task that writes dirty configs back to the database."""
+    while _running:
+        await asyncio.sleep(_PERSIST_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_flush_dirty_configs)
+        except Exception as e:
+            logger.error(f"Config persist error: {e}")
 
 
 # API Endpoints
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve the main dashboard page."""
-    from pathlib import Path
-    html_path = Path(__file__).parent / "static" / "index.html"
-    
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text())
+    if _INDEX_HTML is not None:
+        return _cached_html_response(request, _INDEX_HTML, _INDEX_ETAG)
     else:
-        return HTMLResponse(content="""
-        <html>
-            <head><title>SNMP Agent Monitor</title></head>
-            <body>
-                <h1>SNMP Agent Monitor</h1>
-                <p>Dashboard is loading... If this persists, check static files.</p>
-                <p>API Documentation: <a href="/docs">/docs</a></p>
-            </body>
-        </html>
-        """)
+        return HTMLResponse(content=_INDEX_FALLBACK_HTML)
 
 
 @app.get("/device/{ip}", response_class=HTMLResponse)
-async def device_page(ip: str):
+async def device_page(ip: str, request: Request):
     """Serve the device detail page."""
-    from pathlib import Path
-    html_path = Path(__file__).parent / "static" / "device.html"
-    
-    if html_path.exists():
-        return HTMLResponse(content=html_path.read_text())
+    if _DEVICE_HTML is not None:
+        return _cached_html_response(request, _DEVICE_HTML, _DEVICE_ETAG)
     else:
-        raise HTTPException(status_code=404, detail="Device page not found")
+        return _not_found(_DEVICE_PAGE_NOT_FOUND)
 
 
 @app.get("/api/test-vendor")
-async def test_vendor():
+def test_vendor():
     """Test vendor lookup directly."""
     from ..core.hostname_resolver import OUI_VENDORS, get_vendor_from_mac
     test_macs = ['BC:24:11:B9:AC:38', '84:2F:57:24:50:B6', '98:E7:43:20:F0:44']
@@ -368,129 +621,114 @@ async def test_vendor():
             "oui": oui,
             "in_dict": oui in OUI_VENDORS,
         }
-    return {
+    return _json_response({
         "oui_count": len(OUI_VENDORS),
         "results": results,
-    }
+    })
 
 
-@app.get("/api/devices")
-async def get_devices() -> List[DeviceInfo]:
+def _version_etag(version: int) -> str:
+    """Weak ETag for data at the given data manager version."""
+    return f'W/"{_ETAG_TOKEN}-{version}"'
+
+
+@app.get("/api/devices", response_model=List[DeviceInfo])
+def get_devices(request: Request) -> Response:
     """Get list of all discovered devices."""
-    machines = data_manager.machines
+    global _devices_cache
     
-    devices = []
-    for m in machines:
-        # Get MAC and lookup vendor if needed
-        mac = m.mac_address if hasattr(m, 'mac_address') else ""
-        vendor = m.vendor if hasattr(m, 'vendor') else ""
-        
-        # Lookup vendor from MAC if not already known
-        if mac and (not vendor or vendor == "Unknown"):
-            looked_up_vendor = get_vendor_from_mac(mac)
-            if looked_up_vendor and looked_up_vendor != "Unknown":
-                vendor = looked_up_vendor
-        
-        # Ensure vendor is never empty
-        if not vendor:
-            vendor = "Unknown"
-        
-        devices.append(DeviceInfo(
-            ip=m.ip,
-            hostname=m.hostname,
-            os_type=m.os_type,
-            uptime_seconds=m.uptime_seconds,
-            is_online=m.is_online,
-            last_seen=m.last_seen.isoformat(),
-            collection_method=m.collection_method,
-            mac_address=mac,
-            vendor=vendor,
-            snmp_active=m.snmp_active if hasattr(m, 'snmp_active') else False,
-            dns_name=m.dns_name if hasattr(m, 'dns_name') else "",
-            mdns_name=m.mdns_name if hasattr(m, 'mdns_name') else "",
-            netbios_name=m.netbios_name if hasattr(m, 'netbios_name') else "",
-            snmp_sysname=m.snmp_sysname if hasattr(m, 'snmp_sysname') else "",
-            display_name=m.display_name if hasattr(m, 'display_name') else m.hostname,
-        ))
-    
-    return devices
+    version = data_manager.version
+    etag = _version_etag(version)
+    headers = {"ETag": etag, "Cache-Control": _POLL_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    # Devices change on collection/discovery ticks, not per request
+    cached = _devices_cache
+    if cached and cached[1] == version and time.monotonic() - cached[0] < _DEVICES_CACHE_TTL:
+        return Response(content=cached[2], media_type="application/json", headers=headers)
+    
+    # Per-machine dicts are prebuilt by the data manager (vendor included)
+    body = orjson.dumps(data_manager.get_machine_dicts())
+    _devices_cache = (time.monotonic(), version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/debug/vendor/{mac}")
-async def debug_vendor_lookup(mac: str):
+def debug_vendor_lookup(mac: str):
     """Debug endpoint to test vendor lookup."""
     from ..core.hostname_resolver import OUI_VENDORS
     result = get_vendor_from_mac(mac)
     normalized_mac = mac.upper().replace("-", ":")
     oui = ":".join(normalized_mac.split(":")[:3])
-    return {
+    return _json_response({
         "input_mac": mac,
         "normalized": normalized_mac,
         "oui": oui,
         "lookup_result": result,
         "oui_in_dict": oui in OUI_VENDORS,
         "dict_size": len(OUI_VENDORS),
-    }
+    })
 
 
-@app.get("/api/devices/{ip}/metrics")
-async def get_device_metrics(ip: str) -> DeviceMetrics:
+@app.get("/api/devices/{ip}/metrics", response_model=DeviceMetrics)
+def get_device_metrics(ip: str) -> Response:
     """Get current metrics for a specific device."""
     snapshot = data_manager.get_snapshot(ip)
     
     if not snapshot:
-        raise HTTPException(status_code=404, detail="Device not found")
-    
-    return DeviceMetrics(
-        device=DeviceInfo(
-            ip=snapshot.machine.ip,
-            hostname=snapshot.machine.hostname,
-            os_type=snapshot.machine.os_type,
-            uptime_seconds=snapshot.machine.uptime_seconds,
-            is_online=snapshot.machine.is_online,
-            last_seen=snapshot.machine.last_seen.isoformat(),
-            collection_method=snapshot.machine.collection_method,
-        ),
-        cpu=CPUInfo(
-            usage_percent=snapshot.cpu.usage_percent,
-            core_count=snapshot.cpu.core_count,
-            thread_count=snapshot.cpu.thread_count,
-            frequency_mhz=snapshot.cpu.frequency_mhz,
-            temperature_celsius=snapshot.cpu.temperature_celsius,
-            load_1m=snapshot.cpu.load_1m,
-            load_5m=snapshot.cpu.load_5m,
-            load_15m=snapshot.cpu.load_15m,
-            model_name=snapshot.cpu.model_name,
-        ),
-        memory=MemoryInfo(
-            total_gb=snapshot.memory.total_gb,
-            used_gb=snapshot.memory.used_gb,
-            available_gb=snapshot.memory.available_gb,
-            usage_percent=snapshot.memory.usage_percent,
-            swap_total_gb=snapshot.memory.swap_total_bytes / (1024**3),
-            swap_used_gb=snapshot.memory.swap_used_bytes / (1024**3),
-        ),
-        storage=[
-            StorageDeviceInfo(
-                device=d.device,
-                mount_point=d.mount_point,
-                fs_type=d.fs_type,
-                total_gb=d.total_gb,
-                used_gb=d.used_gb,
-                free_gb=d.free_gb,
-                usage_percent=d.usage_percent,
-                is_ssd=d.is_ssd,
-            )
+        return _not_found(_DEVICE_NOT_FOUND)
+    
+    cpu = snapshot.cpu
+    memory = snapshot.memory
+    
+    # Plain dicts in the DeviceMetrics shape, serialized directly by orjson
+    return _json_response({
+        "device": data_manager.get_machine_dict(ip) or snapshot.machine.to_dict(),
+        "cpu": {
+            "usage_percent": cpu.usage_percent,
+            "core_count": cpu.core_count,
+            "thread_count": cpu.thread_count,
+            "frequency_mhz": cpu.frequency_mhz,
+            "temperature_celsius": cpu.temperature_celsius,
+            "load_1m": cpu.load_1m,
+            "load_5m": cpu.load_5m,
+            "load_15m": cpu.load_15m,
+            "model_name": cpu.model_name,
+        },
+        "memory": {
+            "total_gb": memory.total_gb,
+            "used_gb": memory.used_gb,
+            "available_gb": memory.available_gb,
+            "usage_percent": memory.usage_percent,
+            "swap_total_gb": memory.swap_total_bytes / (1024**3),
+            "swap_used_gb": memory.swap_used_bytes / (1024**3),
+        },
+        "storage": [
+            {
+                "device": d.device,
+                "mount_point": d.mount_point,
+                "fs_type": d.fs_type,
+                "total_gb": d.total_gb,
+                "used_gb": d.used_gb,
+                "free_gb": d.free_gb,
+                "usage_percent": d.usage_percent,
+                "is_ssd": d.is_ssd,
+            }
             for d in snapshot.storage.devices
         ],
-        timestamp=snapshot.timestamp.isoformat(),
-    )
+        "timestamp": snapshot.timestamp.isoformat(),
+    })
 
 
-@app.get("/api/stats")
-async def get_aggregated_stats() -> Dict[str, Any]:
+@app.get("/api/stats", response_model=Dict[str, Any])
+def get_aggregated_stats(request: Request) -> Response:
     """Get aggregated statistics across all devices."""
-    return data_manager.get_aggregated_stats()
+    etag = _version_etag(data_manager.version)
+    headers = {"ETag": etag, "Cache-Control": _POLL_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return _json_response(data_manager.get_aggregated_stats(), headers=headers)
 
 
 @app.get("/api/snmp/oids")
@@ -499,14 +737,9 @@ async def get_snmp_oids(base: Optional[str] = None):
     if snmp_agent is None:
         raise HTTPException(status_code=503, detail="SNMP agent not running")
 
-    if base:
-        data = snmp_agent.walk(base)
-    else:
-        data = snmp_agent.get_all_data()
-
-    # Sort by OID for readable output
-    sorted_oids = sorted(data.items(), key=lambda x: tuple(int(p) for p in x[0].split(".") if p))
-    return {"total": len(sorted_oids), "oids": {k: v for k, v in sorted_oids}}
+    # Already in OID order, as maintained by the agent
+    data = snmp_agent.get_all_data_sorted(base)
+    return _json_response({"total": len(data), "oids": data})
 
 
 @app.post("/api/scan")
@@ -525,7 +758,7 @@ async def trigger_scan(request: ScanRequest, background_tasks: BackgroundTasks):
     
     background_tasks.add_task(do_scan)
     
-    return {"message": "Scan started", "subnets": request.subnets}
+    return _json_response({"message": "Scan started", "subnets": request.subnets})
 
 
 @app.post("/api/config")
@@ -546,40 +779,40 @@ async def update_config(update: ConfigUpdate):
             timeout=config.collection.timeout_seconds,
         )
     
-    return {"message": "Configuration updated", "config": update.dict(exclude_none=True)}
+    return _json_response({"message": "Configuration updated", "config": update.dict(exclude_none=True)})
 
 
 @app.get("/api/config")
-async def get_config():
+def get_config():
     """Get current configuration."""
-    return {
+    return _json_response({
         "collection_interval": config.collection.interval_seconds,
         "discovery_enabled": config.discovery.enabled,
         "collect_remote_snmp": config.collection.collect_remote_snmp,
         "snmp_community": config.collection.snmp_community,
         "subnets": config.discovery.subnets,
-    }
+    })
 
 
 @app.get("/api/mqtt/status")
-async def get_mqtt_status():
+def get_mqtt_status():
     """Get MQTT broker status."""
     if mqtt_service is None:
-        return {
+        return _json_response({
             "enabled": False,
             "status": "not_initialized",
             "port": None,
             "clients": 0,
-        }
+        })
     
-    return {
+    return _json_response({
         "enabled": config.mqtt.enabled,
         "status": "connected" if mqtt_service._client_connected else ("stopped" if config.mqtt.enabled else "disabled"),
         "host": config.mqtt.host,
         "port": config.mqtt.port,
         "topic_prefix": config.mqtt.topic_prefix,
         "connected": mqtt_service._client_connected,
-    }
+    })
 
 
 # Widget Models
@@ -602,15 +835,20 @@ class MQTTDeviceConfig(BaseModel):
 
 # Widget CRUD endpoints
 @app.get("/api/widgets")
-async def list_widgets(device_ip: Optional[str] = None):
+def list_widgets(device_ip: Optional[str] = None):
     """List all widgets, optionally filtered by device IP."""
+    # Copy first: handlers run in worker threads and may race with writes
     if device_ip:
-        return [w for w in _widgets.values() if w.get("device_ip") == device_ip or w.get("device_ip") == "*"]
-    return list(_widgets.values())
+        # Device-specific widgets plus the ones shown on every device ("*")
+        widgets = list(_widgets_by_device.get(device_ip, {}).values())
+        if device_ip != "*":
+            widgets.extend(_widgets_by_device.get("*", {}).values())
+        return _json_response(widgets)
+    return _json_response(list(_widgets.values()))
 
 
 @app.post("/api/widgets")
-async def create_widget(widget: WidgetCreate):
+def create_widget(widget: WidgetCreate):
     """Create a new custom widget."""
     import uuid
     widget_id = str(uuid.uuid4())[:8]
@@ -623,35 +861,36 @@ async def create_widget(widget: WidgetCreate):
         "created_at": datetime.now().isoformat()
     }
     _widgets[widget_id] = widget_data
-    if db:
-        db.save_widget_config(widget_id, widget_data)
-    return widget_data
+    _widgets_by_device.setdefault(widget.device_ip, {})[widget_id] = widget_data
+    _widgets_dirty.add(widget_id)
+    return _json_response(widget_data)
 
 
 @app.delete("/api/widgets/{widget_id}")
-async def delete_widget(widget_id: str):
+def delete_widget(widget_id: str):
     """Delete a widget."""
-    if widget_id not in _widgets:
+    # Single pop: concurrent deletes run in worker threads
+    widget = _widgets.pop(widget_id, None)
+    if widget is None:
         raise HTTPException(status_code=404, detail="Widget not found")
-    del _widgets[widget_id]
-    if db:
-        db.delete_widget_config(widget_id)
-    return {"status": "deleted"}
+    _widgets_by_device.get(widget.get("device_ip"), {}).pop(widget_id, None)
+    _widgets_dirty.add(widget_id)
+    return _json_response({"status": "deleted"})
 
 
 # MQTT Device Configuration endpoints
 @app.get("/api/mqtt/devices")
-async def list_mqtt_device_configs():
+def list_mqtt_device_configs():
     """List all MQTT device configurations."""
-    return list(_mqtt_device_configs.values())
+    return _json_response(list(_mqtt_device_configs.values()))
 
 
 @app.get("/api/mqtt/devices/{device_ip}")
-async def get_mqtt_device_config(device_ip: str):
+def get_mqtt_device_config(device_ip: str):
     """Get MQTT configuration for a specific device."""
     if device_ip not in _mqtt_device_configs:
         # Return default config
-        return {
+        return _json_response({
             "device_ip": device_ip,
             "enabled": False,
             "topic": f"snmp-agent/devices/{device_ip}",
@@ -659,12 +898,12 @@ async def get_mqtt_device_config(device_ip: str):
             "publish_memory": True,
             "publish_storage": True,
             "publish_widgets": True
-        }
-    return _mqtt_device_configs[device_ip]
+        })
+    return _json_response(_mqtt_device_configs[device_ip])
 
 
 @app.post("/api/mqtt/devices")
-async def save_mqtt_device_config(config_data: MQTTDeviceConfig):
+def save_mqtt_device_config(config_data: MQTTDeviceConfig):
     """Save MQTT configuration for a device."""
     device_ip = config_data.device_ip
     mqtt_config = {
@@ -677,29 +916,16 @@ async def save_mqtt_device_config(config_data: MQTTDeviceConfig):
         "publish_widgets": config_data.publish_widgets
     }
     _mqtt_device_configs[device_ip] = mqtt_config
-    if db:
-        db.save_mqtt_config(device_ip, mqtt_config)
-    return mqtt_config
+    _mqtt_configs_dirty.add(device_ip)
+    return _json_response(mqtt_config)
 
 
 @app.get("/api/stream")
 async def stream_updates():
     """Server-sent events stream for real-time updates."""
-    
-    async def event_generator():
-        while True:
-            # Send current stats every 5 seconds
-            stats = data_manager.get_aggregated_stats()
-            yield f"data: {json.dumps(stats)}\n\n"
-            await asyncio.sleep(5)
-    
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
+    # Coalesce bursts of updates (one per device per collection pass)
+    return _sse_response(
+        lambda: _stats_changed, _get_stats_payload, min_interval=_SSE_MIN_INTERVAL_SECONDS
     )
 
 
@@ -708,6 +934,7 @@ class OIDScanRequest(BaseModel):
     base_oids: Optional[List[str]] = None  # If None, scan common MIBs
     max_results: int = 500
     timeout: float = 10.0
+    refresh_oids_cache_interval: float = 3600  # Re-walk after this many seconds; 0 forces a walk
 
 class OIDValue(BaseModel):
     oid: str
@@ -723,10 +950,63 @@ class OIDScanResponse(BaseModel):
 
 class OIDGetRequest(BaseModel):
     oids: List[str]
+    # Skip the collector's short-lived GET cache (explicit user refresh)
+    refresh: bool = False
 
 class OIDWalkRequest(BaseModel):
     base_oid: str
     max_results: int = 100
+    refresh_oids_cache_interval: float = 3600
+
+
+@dataclass
+class ScanProgress:
+    """Progress of the latest OID scan of a device, updated in place."""
+    __slots__ = ("status", "message", "total", "completed")
+
+    status: str  # scanning, processing, complete
+    message: str
+    total: int
+    completed: int
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "message": self.message,
+            "percent": self.completed * 100 // self.total if self.total else 100,
+            "total": self.total,
+            "completed": self.completed,
+        }
+
+
+_scan_progress: Dict[str, ScanProgress] = {}  # device ip -> latest scan
+_scan_progress_changed: Dict[str, asyncio.Event] = {}  # device ip -> SSE wakeup
+
+
+def _scan_progress_dict(ip: str) -> dict:
+    """Progress of a device's latest scan, or an idle placeholder."""
+    progress = _scan_progress.get(ip)
+    if progress is None:
+        return {"status": "idle", "message": "", "percent": 0, "total": 0, "completed": 0}
+    return progress.to_dict()
+
+
+def _notify_scan_progress(ip: str):
+    """Wake SSE clients following a device's scan progress."""
+    event = _scan_progress_changed.pop(ip, None)
+    if event is not None:
+        event.set()
+
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second."""
+    global _now_iso_cache
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_iso_cache[1]
 
 
 # Common MIB OID prefixes for scanning
@@ -767,49 +1047,188 @@ OID_NAMES = {
     "1.3.6.1.4.1.2021.11.11.0": "ssCpuIdle",
 }
 
+# Value type classifier for OID scan results: one fullmatch decides
+# integer vs float (fraction group present) vs string (no match)
+_NUMBER_RE = re.compile(r'-?\d+(\.\d+(?:[eE][+-]?\d+)?)?')
+# Longer values (descriptions, paths) are classified without caching so the
+# cache doesn't pin large strings; numbers from SNMP are always shorter
+_CLASSIFY_CACHE_MAX_LEN = 64
+
+
+@functools.lru_cache(maxsize=65536)
+def _classify_value(value_str: str) -> str:
+    """Return "integer", "float" or "string" for a scanned value."""
+    number = _NUMBER_RE.fullmatch(value_str)
+    if number is None:
+        return "string"
+    return "float" if number.group(1) else "integer"
+
+
+class OidTrie:
+    """Prefix tree over dotted OID components for longest-prefix lookups."""
+
+    def __init__(self, entries: Dict[str, Any]):
+        split = {oid: oid.split('.') for oid in entries}
+
+        # Components shared by every entry (e.g. "1.3.6.1") are checked with
+        # a single startswith instead of one node per component
+        shared: List[str] = []
+        if split:
+            shortest = min(len(parts) for parts in split.values())
+            for column in zip(*split.values()):
+                if len(shared) == shortest - 1 or len(set(column)) != 1:
+                    break
+                shared.append(column[0])
+        self._prefix = ".".join(shared) + "." if shared else ""
+
+        self._root: Dict[str, Any] = {}
+        for oid, value in entries.items():
+            node = self._root
+            for part in split[oid][len(shared):]:
+                node = node.setdefault(part, {})
+            node[None] = value  # Payload for an OID ending at this node
+
+    def match_path(self, oid: str) -> List[Tuple[Any, int]]:
+        """Return (value, end) for each known prefix of *oid*, shortest first.
+
+        ``oid[:end]`` is the matched prefix; ``oid[end:]`` is the unmatched
+        tail, starting with "." (or empty on an exact match).
+        """
+        prefix = self._prefix
+        if not oid.startswith(prefix):
+            return []
+        matches = []
+        node = self._root
+        pos = len(prefix)
+        for part in oid[pos:].split('.'):
+            node = node.get(part)
+            if node is None:
+                break
+            pos += len(part) + 1
+            if None in node:
+                matches.append((node[None], pos - 1))
+        return matches
+
+
+# One trie for both lookups; each node's payload is (name, category), with
+# None for whichever the OID doesn't define
+_CATEGORY_BY_PREFIX = {prefix: category for category, (prefix, _) in COMMON_MIB_OIDS.items()}
+_OID_META_TRIE = OidTrie({
+    oid: (OID_NAMES.get(oid), _CATEGORY_BY_PREFIX.get(oid))
+    for oid in {**OID_NAMES, **_CATEGORY_BY_PREFIX}
+})
+# Parents of named OIDs: only their children can be exact OID_NAMES hits
+# deeper than the trie match of the parent
+_OID_NAME_PARENTS = frozenset(oid.rpartition('.')[0] for oid in OID_NAMES)
+
+
+def _oid_meta(oid: str) -> Tuple[Optional[str], str]:
+    """Walk the trie once for the OID's name (None if unnamed) and category."""
+    name, name_end, category = None, 0, "other"
+    for (node_name, node_category), end in _OID_META_TRIE.match_path(oid):
+        if node_name is not None:
+            name, name_end = node_name, end
+        if node_category is not None:
+            category = node_category
+    # Any remaining components (table indexes, instance suffixes) are
+    # appended to the deepest known name
+    return (None if name is None else name + oid[name_end:]), category
+
+
+def get_oid_meta(oid: str) -> Tuple[str, str]:
+    """Get the human-readable name and category of an OID."""
+    name, category = _oid_meta(oid)
+    return (oid if name is None else name), category
+
+
 def get_oid_name(oid: str) -> str:
     """Get human-readable name for an OID."""
-    # Exact match
-    if oid in OID_NAMES:
-        return OID_NAMES[oid]
-    
-    # Check for table entries (strip last index)
-    parts = oid.rsplit('.', 1)
-    if len(parts) == 2:
-        base_oid = parts[0]
-        if base_oid in OID_NAMES:
-            return f"{OID_NAMES[base_oid]}.{parts[1]}"
-    
-    # Check for prefix match
-    for known_oid, name in OID_NAMES.items():
-        if oid.startswith(known_oid):
-            suffix = oid[len(known_oid):]
-            return f"{name}{suffix}"
-    
-    return oid  # Return OID if no name found
+    return get_oid_meta(oid)[0]
 
 def categorize_oid(oid: str) -> str:
     """Categorize an OID based on its prefix."""
-    for category, (prefix, _) in COMMON_MIB_OIDS.items():
-        if oid.startswith(prefix):
-            return category
-    return "other"
+    return _oid_meta(oid)[1]
+
+
+def _build_scan_categories(walks: List[Dict[str, Any]], max_results: int):
+    """Name, type and categorize walked OIDs, up to *max_results* entries."""
+    all_results = {}
+    categories: Dict[str, List] = defaultdict(list)
+    # Table rows share everything but the last component: resolve each
+    # column's name and category list once and reuse them for its rows
+    column_meta: Dict[str, Tuple[Optional[str], List, bool]] = {}
+    
+    for results in walks:
+        remaining = max_results - len(all_results)
+        if remaining <= 0:
+            break
+        # Subtrees can overlap (e.g. lm_sensors within ucd_snmp); the slice
+        # bounds the row count so the loop needs no per-row limit check
+        rows = islice(
+            ((oid, value) for oid, value in results.items() if oid not in all_results),
+            remaining,
+        )
+        for oid, value in rows:
+            column, _, index = oid.rpartition('.')
+            meta = column_meta.get(column)
+            if meta is None:
+                name, category = _oid_meta(column)
+                meta = column_meta[column] = (
+                    name,
+                    categories[category],
+                    column in _OID_NAME_PARENTS,
+                )
+            column_name, category_rows, has_exact = meta
+            
+            # Same result as get_oid_name(oid): an exact entry wins, otherwise
+            # the row index is appended to the column's name
+            oid_name = OID_NAMES.get(oid) if has_exact else None
+            if oid_name is None:
+                oid_name = oid if column_name is None else f"{column_name}.{index}"
+            
+            value_str = str(value)
+            # Repeat scans see the same counter/gauge values; reuse their type
+            if len(value_str) <= _CLASSIFY_CACHE_MAX_LEN:
+                value_type = _classify_value(value_str)
+            else:
+                value_type = _classify_value.__wrapped__(value_str)
+            
+            # Plain dict matching OIDValue; serialized directly by orjson
+            oid_entry = {
+                "oid": oid,
+                "name": oid_name,
+                "value": value_str[:200],  # Truncate long values
+                "value_type": value_type,
+            }
+            
+            category_rows.append(oid_entry)
+            all_results[oid] = oid_entry
+    
+    return all_results, categories
+
+
+# The category list is static; encode it once
+_OID_CATEGORIES_BODY = orjson.dumps({
+    "categories": [
+        {"id": cat, "oid_prefix": prefix, "description": desc}
+        for cat, (prefix, desc) in COMMON_MIB_OIDS.items()
+    ]
+})
 
 
 @app.get("/api/devices/{ip}/oids/categories")
 async def get_oid_categories(ip: str):
     """Get available OID categories to scan."""
-    return {
-        "categories": [
-            {"id": cat, "oid_prefix": prefix, "description": desc}
-            for cat, (prefix, desc) in COMMON_MIB_OIDS.items()
-        ]
-    }
+    return Response(content=_OID_CATEGORIES_BODY, media_type="application/json")
 
 
-@app.post("/api/devices/{ip}/oids/scan")
-async def scan_device_oids(ip: str, request: OIDScanRequest):
-    """Scan a device for available SNMP OIDs."""
+@app.post("/api/devices/{ip}/oids/scan", response_model=OIDScanResponse)
+async def scan_device_oids(ip: str, request: OIDScanRequest, raw_request: Request):
+    """Scan a device for available SNMP OIDs.
+    
+    Clients sending ``Accept: application/x-ndjson`` get one JSON line per
+    OID as each subtree walk finishes, followed by a summary line.
+    """
     if snmp_collector is None:
         raise HTTPException(status_code=503, detail="SNMP collector not initialized")
     
@@ -820,52 +1239,115 @@ async def scan_device_oids(ip: str, request: OIDScanRequest):
         # Default to common MIBs
         base_oids = [prefix for prefix, _ in COMMON_MIB_OIDS.values()]
     
-    all_results = {}
-    categories = {}
+    progress = ScanProgress(
+        status="scanning",
+        message=f"Scanning {len(base_oids)} OID trees...",
+        total=len(base_oids),
+        completed=0,
+    )
+    _scan_progress[ip] = progress
+    _notify_scan_progress(ip)
     
-    for base_oid in base_oids:
+    # Cap concurrent walks so a slow agent isn't flooded with GETNEXTs
+    walk_limit = asyncio.Semaphore(max(1, config.collection.max_concurrent_walks))
+    
+    async def walk(base_oid: str) -> Dict[str, Any]:
+        # A cancelled walk (the NDJSON stream stopped early) propagates
+        # without touching progress, which the stream has already finalized
         try:
-            results = await snmp_collector._walk_oid(ip, base_oid)
-            
-            for oid, value in results.items():
-                if len(all_results) >= request.max_results:
-                    break
-                    
-                oid_name = get_oid_name(oid)
-                category = categorize_oid(oid)
-                
-                value_str = str(value)
-                value_type = "string"
-                try:
-                    int(value_str)
-                    value_type = "integer"
-                except ValueError:
-                    try:
-                        float(value_str)
-                        value_type = "float"
-                    except ValueError:
-                        pass
-                
-                oid_entry = OIDValue(
-                    oid=oid,
-                    name=oid_name,
-                    value=value_str[:200],  # Truncate long values
-                    value_type=value_type,
+            async with walk_limit:
+                results = await snmp_collector._walk_oid_cached(
+                    ip, base_oid, request.refresh_oids_cache_interval
                 )
-                
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(oid_entry)
-                all_results[oid] = oid_entry
-                
         except Exception as e:
             logger.debug(f"Error scanning {base_oid} on {ip}: {e}")
+            results = {}
+        progress.completed += 1
+        progress.message = f"Scanned {base_oid} ({progress.completed}/{progress.total})"
+        _notify_scan_progress(ip)
+        return results
+    
+    # Naming/classifying thousands of OIDs is pure Python; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    
+    if "application/x-ndjson" in raw_request.headers.get("accept", ""):
+        async def stream_rows():
+            seen = set()
+            tasks = [asyncio.ensure_future(walk(base_oid)) for base_oid in base_oids]
+            try:
+                for next_walk in asyncio.as_completed(tasks):
+                    # Stop before waiting on another walk once the cap is hit
+                    if len(seen) >= request.max_results:
+                        break
+                    results = await next_walk
+                    remaining = request.max_results - len(seen)
+                    # Subtrees can overlap (e.g. lm_sensors within ucd_snmp)
+                    new = {oid: value for oid, value in results.items() if oid not in seen}
+                    if not new:
+                        continue
+                    rows, categories = await loop.run_in_executor(
+                        app.state.pool, _build_scan_categories, [new], remaining
+                    )
+                    seen.update(rows)
+                    yield b"".join(
+                        orjson.dumps({"category": category, **entry}) + b"\n"
+                        for category, entries in categories.items()
+                        for entry in entries
+                    )
+            finally:
+                # Stop outstanding walks on early exit or client disconnect
+                for task in tasks:
+                    task.cancel()
+            
+            progress.status = "complete"
+            progress.message = f"Found {len(seen)} OIDs"
+            _notify_scan_progress(ip)
+            yield orjson.dumps({
+                "ip": ip,
+                "scan_time": _now_iso(),
+                "total_oids": len(seen),
+            }) + b"\n"
+        
+        return StreamingResponse(
+            stream_rows(),
+            media_type="application/x-ndjson",
+            # Don't let GZipMiddleware buffer rows meant to arrive incrementally
+            headers={"Content-Encoding": "identity"},
+        )
+    
+    # Walk prefixes concurrently; they are independent queries
+    walks = await asyncio.gather(*(walk(base_oid) for base_oid in base_oids))
+    progress.status = "processing"
+    progress.message = "Processing results..."
+    _notify_scan_progress(ip)
     
-    return OIDScanResponse(
-        ip=ip,
-        scan_time=datetime.now().isoformat(),
-        total_oids=len(all_results),
-        categories=categories,
+    all_results, categories = await loop.run_in_executor(
+        app.state.pool, _build_scan_categories, walks, request.max_results
+    )
+    progress.status = "complete"
+    progress.message = f"Found {len(all_results)} OIDs"
+    _notify_scan_progress(ip)
+    
+    return _json_response({
+        "ip": ip,
+        "scan_time": _now_iso(),
+        "total_oids": len(all_results),
+        "categories": categories,
+    })
+
+
+@app.get("/api/devices/{ip}/oids/scan/progress")
+def get_scan_progress(ip: str):
+    """Get progress of the latest OID scan of a device."""
+    return _json_response(_scan_progress_dict(ip))
+
+
+@app.get("/api/devices/{ip}/oids/scan/progress/stream")
+async def stream_scan_progress(ip: str):
+    """Server-sent events stream of a device's OID scan progress."""
+    return _sse_response(
+        lambda: _scan_progress_changed.setdefault(ip, asyncio.Event()),
+        lambda: orjson.dumps(_scan_progress_dict(ip)),
     )
 
 
@@ -875,21 +1357,25 @@ async def get_oid_values(ip: str, request: OIDGetRequest):
     if snmp_collector is None:
         raise HTTPException(status_code=503, detail="SNMP collector not initialized")
     
+    # Issue the GETs concurrently (bounded by the collector) rather than
+    # one round-trip after another
+    values = await snmp_collector._get_oid_each(
+        ip, request.oids, max_age=0 if request.refresh else None
+    )
+    
     results = []
-    for oid in request.oids:
-        try:
-            value = await snmp_collector._get_oid(ip, oid)
-            if value is not None:
-                results.append(OIDValue(
-                    oid=oid,
-                    name=get_oid_name(oid),
-                    value=str(value),
-                    value_type="string",
-                ))
-        except Exception as e:
-            logger.debug(f"Error getting OID {oid} from {ip}: {e}")
+    for oid, value in zip(request.oids, values):
+        if isinstance(value, Exception):
+            logger.debug(f"Error getting OID {oid} from {ip}: {value}")
+        elif value is not None:
+            results.append({
+                "oid": oid,
+                "name": get_oid_name(oid),
+                "value": str(value),
+                "value_type": "string",
+            })
     
-    return {"ip": ip, "oids": results}
+    return _json_response({"ip": ip, "oids": results})
 
 
 @app.post("/api/devices/{ip}/oids/walk")
@@ -899,23 +1385,21 @@ async def walk_oid_subtree(ip: str, request: OIDWalkRequest):
         raise HTTPException(status_code=503, detail="SNMP collector not initialized")
     
     try:
-        results = await snmp_collector._walk_oid(ip, request.base_oid)
+        results = await snmp_collector._walk_oid_cached(
+            ip, request.base_oid, request.refresh_oids_cache_interval
+        )
         
-        oid_values = []
-        for oid, value in list(results.items())[:request.max_results]:
-            oid_values.append(OIDValue(
-                oid=oid,
-                name=get_oid_name(oid),
-                value=str(value)[:200],
-                value_type="string",
-            ))
+        oid_values = [
+            {"oid": oid, "name": get_oid_name(oid), "value": str(value)[:200], "value_type": "string"}
+            for oid, value in islice(results.items(), request.max_results)
+        ]
         
-        return {
+        return _json_response({
             "ip": ip,
             "base_oid": request.base_oid,
             "count": len(oid_values),
             "oids": oid_values,
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -931,11 +1415,19 @@ def start_web_server(
     if app_config:
         config = app_config
     
-    logger.info(f"Starting web server on http://{host}:{port}")
+    # Prefer the C-accelerated event loop and HTTP parser when installed
+    # (uvicorn[standard]); fall back to the pure-Python implementations.
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http_impl = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
+    logger.info(f"Starting web server on http://{host}:{port} (loop={loop_impl}, http={http_impl})")
     
     uvicorn.run(
         app,
         host=host,
         port=port,
+        loop=loop_impl,
+        http=http_impl,
         log_level="info",
+        access_log=False,  # Dashboard polling would otherwise log every request
     )
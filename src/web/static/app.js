@@ -665,7 +665,8 @@ class SNMPMonitor {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
                     base_oids: [baseOid],
-                    max_results: 200
+                    max_results: 200,
+                    refresh_oids_cache_interval: 0  // User-started: always re-walk
                 })
             });
             
@@ -699,7 +700,8 @@ class SNMPMonitor {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
                     base_oids: baseOids,
-                    max_results: 500
+                    max_results: 500,
+                    refresh_oids_cache_interval: 0  // User-started: always re-walk
                 })
             });
             
@@ -725,7 +727,8 @@ class SNMPMonitor {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
                     base_oid: oid,
-                    max_results: 100
+                    max_results: 100,
+                    refresh_oids_cache_interval: 0  // User-started: always re-walk
                 })
             });
             
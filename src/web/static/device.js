@@ -447,37 +447,75 @@ class DeviceMonitor {
         resultsDiv.innerHTML = '<div class="loading">🔍 Starting scan...</div>';
         document.getElementById('oid-count').textContent = '';
         
+        // Progress is pushed by the server as each subtree walk finishes
+        const progressSource = new EventSource(`/api/devices/${this.deviceIp}/oids/scan/progress/stream`);
+        progressSource.onmessage = (event) => {
+            const progress = JSON.parse(event.data);
+            if (progress.status === 'scanning') {
+                resultsDiv.innerHTML = `<div class="loading">🔍 ${progress.message} (${progress.percent}%)</div>`;
+            }
+        };
+        
         try {
-            // Start polling for progress
-            const progressInterval = setInterval(async () => {
-                try {
-                    const progressRes = await fetch(`/api/devices/${this.deviceIp}/oids/scan/progress`);
-                    if (progressRes.ok) {
-                        const progress = await progressRes.json();
-                        if (progress.status === 'scanning') {
-                            resultsDiv.innerHTML = `<div class="loading">🔍 ${progress.message} (${progress.percent}%)</div>`;
-                        }
-                    }
-                } catch (e) {
-                    // Ignore polling errors
-                }
-            }, 500);
 
             const response = await fetch(`/api/devices/${this.deviceIp}/oids/scan`, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/x-ndjson'
+                },
                 body: JSON.stringify({
                     base_oids: baseOids,
-                    max_results: 500
+                    max_results: 500,
+                    refresh_oids_cache_interval: 0  // User-started: always re-walk
                 })
             });
             
-            clearInterval(progressInterval);
+            if (!response.ok) {
+                throw new Error(`Scan failed: ${response.status}`);
+            }
+            
+            // Rows arrive as newline-delimited JSON as each subtree finishes;
+            // render what we have after every chunk
+            const data = { categories: {}, total_oids: 0 };
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                
+                let added = false;
+                for (const line of lines) {
+                    if (!line) continue;
+                    const row = JSON.parse(line);
+                    if (row.oid === undefined) {
+                        // Final summary line
+                        Object.assign(data, row);
+                        continue;
+                    }
+                    const { category, ...oid } = row;
+                    (data.categories[category] = data.categories[category] || []).push(oid);
+                    data.total_oids++;
+                    added = true;
+                }
+                
+                if (added) {
+                    progressSource.close();
+                    this.renderScanResults(data);
+                }
+            }
+            
+            progressSource.close();
             
-            const data = await response.json();
             this.currentOidData = data;
             this.renderScanResults(data);
         } catch (error) {
+            progressSource.close();
             console.error('OID scan failed:', error);
             resultsDiv.innerHTML = '<div class="error">Failed to scan OIDs</div>';
         }
@@ -553,7 +591,10 @@ class DeviceMonitor {
             const response = await fetch(`/api/devices/${this.deviceIp}/oids/get`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ oids: [oid] })
+                body: JSON.stringify({
+                    oids: [oid],
+                    refresh: true  // User-started: skip the short GET cache
+                })
             });
             
             const data = await response.json();
@@ -575,7 +616,11 @@ class DeviceMonitor {
             const response = await fetch(`/api/devices/${this.deviceIp}/oids/walk`, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ base_oid: oid, max_results: 100 })
+                body: JSON.stringify({
+                    base_oid: oid,
+                    max_results: 100,
+                    refresh_oids_cache_interval: 0  // User-started: always re-walk
+                })
             });
             
             const data = await response.json();
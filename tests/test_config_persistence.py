@@ -0,0 +1,82 @@
+"""
+Tests for batched write-back of widget and MQTT device configs.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.web import api
+
+
+class FakeDatabase:
+    """Records config writes; optionally fails widget saves."""
+
+    def __init__(self, fail_widget_saves: bool = False):
+        self.fail_widget_saves = fail_widget_saves
+        self.widgets = {}
+        self.deleted = []
+        self.mqtt = {}
+
+    def save_widget_configs(self, widgets):
+        if self.fail_widget_saves:
+            raise RuntimeError("database is locked")
+        self.widgets.update(widgets)
+
+    def delete_widget_configs(self, widget_ids):
+        self.deleted.extend(widget_ids)
+
+    def save_mqtt_configs(self, configs):
+        self.mqtt.update(configs)
+
+
+@pytest.fixture
+def state(monkeypatch):
+    monkeypatch.setattr(api, "_widgets", {"w1": {"id": "w1", "device_ip": "10.0.0.1"}})
+    monkeypatch.setattr(api, "_widgets_dirty", {"w1", "w-deleted"})
+    monkeypatch.setattr(api, "_mqtt_device_configs", {"10.0.0.1": {"device_ip": "10.0.0.1"}})
+    monkeypatch.setattr(api, "_mqtt_configs_dirty", {"10.0.0.1"})
+    return monkeypatch
+
+
+def test_flush_writes_dirty_configs(state):
+    db = FakeDatabase()
+    state.setattr(api, "db", db)
+
+    api._flush_dirty_configs()
+
+    assert db.widgets == {"w1": {"id": "w1", "device_ip": "10.0.0.1"}}
+    assert db.deleted == ["w-deleted"]
+    assert db.mqtt == {"10.0.0.1": {"device_ip": "10.0.0.1"}}
+    assert not api._widgets_dirty
+    assert not api._mqtt_configs_dirty
+
+
+def test_failed_flush_keeps_changes_dirty(state):
+    db = FakeDatabase(fail_widget_saves=True)
+    state.setattr(api, "db", db)
+
+    with pytest.raises(RuntimeError):
+        api._flush_dirty_configs()
+
+    assert api._widgets_dirty == {"w1", "w-deleted"}
+    assert api._mqtt_configs_dirty == {"10.0.0.1"}
+
+    # The next flush retries everything that wasn't written
+    db.fail_widget_saves = False
+    api._flush_dirty_configs()
+    assert "w1" in db.widgets
+    assert db.deleted == ["w-deleted"]
+    assert "10.0.0.1" in db.mqtt
+    assert not api._widgets_dirty
+    assert not api._mqtt_configs_dirty
+
+
+def test_flush_without_database_is_a_no_op(state):
+    state.setattr(api, "db", None)
+    api._flush_dirty_configs()
+    assert api._widgets_dirty == {"w1", "w-deleted"}
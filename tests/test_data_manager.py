@@ -0,0 +1,103 @@
+"""
+Tests for the data manager's versioning and cached derived data.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config import Config
+from src.core.data_manager import DataManager
+from src.core.models import (
+    CPUMetrics,
+    HardwareSnapshot,
+    MachineInfo,
+    MemoryMetrics,
+    NetworkMetrics,
+    PowerMetrics,
+    StorageMetrics,
+)
+
+
+def make_snapshot(ip: str, cpu: float = 10.0, **machine_fields) -> HardwareSnapshot:
+    return HardwareSnapshot(
+        machine=MachineInfo(ip=ip, **machine_fields),
+        cpu=CPUMetrics(usage_percent=cpu),
+        memory=MemoryMetrics(total_bytes=4 * 1024**3, used_bytes=1024**3),
+        storage=StorageMetrics(),
+        power=PowerMetrics(),
+        network=NetworkMetrics(),
+    )
+
+
+def test_version_bumps_and_notifies():
+    manager = DataManager(Config())
+    calls = []
+    manager.add_change_listener(lambda: calls.append(manager.version))
+
+    asyncio.run(manager.add_machine(MachineInfo(ip="10.0.0.1")))
+    asyncio.run(manager.update_snapshot(make_snapshot("10.0.0.1")))
+    asyncio.run(manager.remove_machine("10.0.0.1"))
+
+    assert calls == [1, 2, 3]
+    assert manager.version == 3
+
+
+def test_stats_cached_until_change():
+    manager = DataManager(Config())
+    asyncio.run(manager.update_snapshot(make_snapshot("10.0.0.1", cpu=10.0)))
+
+    stats = manager.get_aggregated_stats()
+    assert stats["machine_count"] == 1
+    assert stats["avg_cpu_percent"] == 10.0
+    assert manager.get_aggregated_stats() is stats
+
+    asyncio.run(manager.update_snapshot(make_snapshot("10.0.0.2", cpu=30.0)))
+    stats = manager.get_aggregated_stats()
+    assert stats["machine_count"] == 2
+    assert stats["avg_cpu_percent"] == 20.0
+
+
+def test_stats_tagged_with_version_seen_before_computing():
+    manager = DataManager(Config())
+    asyncio.run(manager.update_snapshot(make_snapshot("10.0.0.1")))
+
+    # Simulate an update landing while the stats are being computed
+    compute = manager._compute_aggregated_stats
+
+    def compute_during_update():
+        stats = compute()
+        manager._mark_changed()
+        return stats
+
+    manager._compute_aggregated_stats = compute_during_update
+    stale = manager.get_aggregated_stats()
+    manager._compute_aggregated_stats = compute
+
+    # The update made the cached stats stale, so they must be recomputed
+    assert manager.get_aggregated_stats() is not stale
+
+
+def test_machine_dicts_rebuilt_after_merge():
+    manager = DataManager(Config())
+    asyncio.run(manager.add_machine(MachineInfo(ip="10.0.0.1")))
+    assert manager.get_machine_dict("10.0.0.1")["hostname"] == "unknown"
+
+    asyncio.run(manager.add_machine(MachineInfo(ip="10.0.0.1", hostname="nas")))
+    assert manager.get_machine_dict("10.0.0.1")["hostname"] == "nas"
+
+    asyncio.run(manager.update_snapshots([make_snapshot("10.0.0.1", hostname="nas2")]))
+    assert [d["hostname"] for d in manager.get_machine_dicts()] == ["nas2"]
+
+    asyncio.run(manager.remove_machine("10.0.0.1"))
+    assert manager.get_machine_dict("10.0.0.1") is None
+    assert manager.get_machine_dicts() == []
+
+
+def test_machine_dict_resolves_vendor():
+    manager = DataManager(Config())
+    asyncio.run(manager.add_machine(MachineInfo(ip="10.0.0.1", mac_address="00:50:56:01:02:03")))
+    assert manager.get_machine_dict("10.0.0.1")["vendor"] == "VMware"
@@ -0,0 +1,133 @@
+"""
+Tests for OID naming, categorization and scan result building.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.web.api import (
+    OID_NAMES,
+    OidTrie,
+    _build_scan_categories,
+    _classify_value,
+    _oid_meta,
+    categorize_oid,
+    get_oid_meta,
+    get_oid_name,
+)
+
+
+def test_trie_match_path_returns_prefixes_shortest_first():
+    trie = OidTrie({"1.3.6.1.2": "a", "1.3.6.1.2.1.5": "b", "1.3.6.1.4": "c"})
+    oid = "1.3.6.1.2.1.5.7"
+    matches = trie.match_path(oid)
+    assert [value for value, _ in matches] == ["a", "b"]
+    assert [oid[:end] for _, end in matches] == ["1.3.6.1.2", "1.3.6.1.2.1.5"]
+    assert oid[matches[-1][1]:] == ".7"
+
+
+def test_trie_matches_whole_components_only():
+    trie = OidTrie({"1.3.6.1.2.1.25": "hr"})
+    assert trie.match_path("1.3.6.1.2.1.25.1") == [("hr", len("1.3.6.1.2.1.25"))]
+    assert trie.match_path("1.3.6.1.2.1.250.1") == []
+    assert trie.match_path("1.3.6.2") == []
+
+
+def test_exact_names():
+    for oid, name in OID_NAMES.items():
+        assert get_oid_name(oid) == name
+
+
+def test_table_index_names():
+    assert get_oid_name("1.3.6.1.2.1.25.3.3.1.2.196608") == "hrProcessorLoad.196608"
+    assert get_oid_name("1.3.6.1.2.1.25.2.3.1.3.1") == "hrStorageDescr.1"
+    assert get_oid_name("1.3.6.1.2.1.25.2.3.1.6.31") == "hrStorageUsed.31"
+
+
+def test_unknown_oid_keeps_numeric_name():
+    assert get_oid_name("1.3.6.1.4.1.99999.1.1.0") == "1.3.6.1.4.1.99999.1.1.0"
+    assert _oid_meta("1.3.6.1.4.1.99999.1.1.0") == (None, "other")
+
+
+def test_categories():
+    assert categorize_oid("1.3.6.1.2.1.1.5.0") == "system"
+    assert categorize_oid("1.3.6.1.2.1.2.2.1.2.1") == "interfaces"
+    assert categorize_oid("1.3.6.1.2.1.25.3.3.1.2.196608") == "host_resources"
+    assert categorize_oid("1.3.6.1.2.1.25.2.3.1.5.1") == "host_resources"
+    assert categorize_oid("1.3.6.1.4.1.2021.4.5.0") == "ucd_snmp"
+    assert categorize_oid("1.3.6.1.4.1.8072.1.3.2.3.1.1.4.116.101.115.116") == "net_snmp_extend"
+    assert categorize_oid("1.3.6.1.9") == "other"
+
+
+def test_lm_sensors_is_more_specific_than_ucd_snmp():
+    assert categorize_oid("1.3.6.1.4.1.2021.13.16.2.1.3.1") == "lm_sensors"
+    assert get_oid_meta("1.3.6.1.4.1.2021.13.16.2.1.3.1")[1] == "lm_sensors"
+
+
+def test_classify_value():
+    assert _classify_value("42") == "integer"
+    assert _classify_value("-7") == "integer"
+    assert _classify_value("3.14") == "float"
+    assert _classify_value("-0.5") == "float"
+    assert _classify_value("1.5e3") == "float"
+    assert _classify_value("") == "string"
+    assert _classify_value("Linux host 6.1") == "string"
+    assert _classify_value("192.168.1.1") == "string"
+
+
+def test_build_scan_categories_names_and_types_rows():
+    walks = [
+        {
+            "1.3.6.1.2.1.1.5.0": "host",
+            "1.3.6.1.2.1.25.3.3.1.2.196608": 12,
+            "1.3.6.1.2.1.25.3.3.1.2.196609": 8,
+            "1.3.6.1.4.1.2021.10.1.3.1": "0.25",
+        },
+    ]
+    rows, categories = _build_scan_categories(walks, max_results=100)
+
+    assert rows["1.3.6.1.2.1.1.5.0"] == {
+        "oid": "1.3.6.1.2.1.1.5.0",
+        "name": "sysName",
+        "value": "host",
+        "value_type": "string",
+    }
+    assert rows["1.3.6.1.2.1.25.3.3.1.2.196609"]["name"] == "hrProcessorLoad.196609"
+    assert rows["1.3.6.1.2.1.25.3.3.1.2.196609"]["value_type"] == "integer"
+    # Exact entries win over the column name + index form
+    assert rows["1.3.6.1.4.1.2021.10.1.3.1"]["name"] == "laLoad.1min"
+    assert rows["1.3.6.1.4.1.2021.10.1.3.1"]["value_type"] == "float"
+
+    assert [row["oid"] for row in categories["host_resources"]] == [
+        "1.3.6.1.2.1.25.3.3.1.2.196608",
+        "1.3.6.1.2.1.25.3.3.1.2.196609",
+    ]
+    assert len(categories["system"]) == 1
+    assert len(categories["ucd_snmp"]) == 1
+
+    # Names match the single-OID lookup
+    for oid, row in rows.items():
+        assert row["name"] == get_oid_name(oid)
+
+
+def test_build_scan_categories_dedupes_and_caps():
+    sensors = {f"1.3.6.1.4.1.2021.13.16.2.1.3.{i}": 40000 + i for i in range(1, 6)}
+    ucd = {"1.3.6.1.4.1.2021.4.5.0": 2048, **sensors}
+
+    rows, categories = _build_scan_categories([sensors, ucd], max_results=100)
+    assert len(rows) == 6
+    assert len(categories["lm_sensors"]) == 5
+    assert len(categories["ucd_snmp"]) == 1
+
+    rows, categories = _build_scan_categories([sensors, ucd], max_results=3)
+    assert len(rows) == 3
+    assert sum(len(entries) for entries in categories.values()) == 3
+
+
+def test_build_scan_categories_truncates_long_values():
+    rows, _ = _build_scan_categories([{"1.3.6.1.2.1.1.1.0": "x" * 500}], max_results=10)
+    assert rows["1.3.6.1.2.1.1.1.0"]["value"] == "x" * 200
+    assert rows["1.3.6.1.2.1.1.1.0"]["value_type"] == "string"
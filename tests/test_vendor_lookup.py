@@ -0,0 +1,37 @@
+"""
+Tests for MAC address vendor lookup.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.hostname_resolver import OUI_VENDORS, get_vendor_from_mac
+
+
+def test_known_ouis():
+    for oui, vendor in OUI_VENDORS.items():
+        assert get_vendor_from_mac(f"{oui}:12:34:56") == vendor
+
+
+def test_separators_and_case():
+    assert get_vendor_from_mac("00:50:56:01:02:03") == "VMware"
+    assert get_vendor_from_mac("00-50-56-01-02-03") == "VMware"
+    assert get_vendor_from_mac("bc:24:11:b9:ac:38") == get_vendor_from_mac("BC:24:11:B9:AC:38")
+
+
+def test_unpadded_octets():
+    # macOS `arp -a` drops leading zeros
+    assert get_vendor_from_mac("0:50:56:1:2:3") == "VMware"
+    # 00:05:05 is not in the table; must not be read as 00:50:56
+    assert "00:05:05" not in OUI_VENDORS
+    assert get_vendor_from_mac("0:05:05:60:00:00") == "Unknown"
+
+
+def test_invalid_addresses():
+    assert get_vendor_from_mac("") == "Unknown"
+    assert get_vendor_from_mac("00:50") == "Unknown"
+    assert get_vendor_from_mac("zz:zz:zz:00:00:00") == "Unknown"
+    assert get_vendor_from_mac("123:4:5:6:7:8") == "Unknown"